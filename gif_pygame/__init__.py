@@ -1,2 +1,2 @@
-from gif_pygame.gif_pygame import load, PygameGIF, GIFPygame, version
+from gif_pygame.gif_pygame import load, load_async, render_many, PygameGIF, GIFPygame, version
 import gif_pygame.transform as transform
\ No newline at end of file
@@ -57,15 +57,12 @@ class PygameGIF:
 		self.frames = []
 		for frame in range(self.gif.n_frames):
 			self.gif.seek(frame)
-			if frame == 0:
-				if "duration" in self.gif.info:
-					self.frames.append([pygame.image.load(filepath), self.gif.info["duration"]*.001])
-				else:
-					self.frames.append([pygame.image.load(filepath), 1])
-			else:
-				self.frames.append([pygame.image.frombytes(self.gif.tobytes(), self.gif.size, self.gif.mode), self.gif.info["duration"]*.001])
+			rgba = self.gif.convert("RGBA")
+			self.frames.append([pygame.image.frombytes(rgba.tobytes(), rgba.size, "RGBA"), self.gif.info.get("duration", 1000)*.001])
 		
+		self._n_frames = self.gif.n_frames
 		self.gif.close()
+		del self.gif
 		self.frame = 0
 		self.frame_time = 0
 		self.paused_time = 0
@@ -79,9 +76,9 @@ class PygameGIF:
 			self.frame_time = time.time()
 
 		if time.time()-self.frame_time >= self.frames[self.frame][1] and not self.paused and not self.ended:
-			if self.frame >= self.gif.n_frames-1:
+			if self.frame >= self._n_frames-1:
 				self.loops[0] += 1
-			self.frame = self.frame + 1 if self.frame < self.gif.n_frames-1 else 0
+			self.frame = self.frame + 1 if self.frame < self._n_frames-1 else 0
 			self.frame_time = time.time()
 
 		
@@ -355,8 +352,8 @@ class PygameGIF:
 		warnings.warn("gif_pygame.PygameGIF.set_alpha deprecated since 1.0.0, use gif_pygame.transform.alphas instead", DeprecationWarning, 2)
 		selected_frames = self._grab_frame(select_frame, first_frame, last_frame)
 
-		for index, _ in enumerate(selected_frames):
-			self.frames[index][0].set_alpha(alpha)
+		for surface, _ in selected_frames:
+			surface.set_alpha(alpha)
 
 
 	def convert(self, colorkey: Optional[Union[None, _ColorValue]] = None, select_frame: Optional[Union[None, SupportsIndex]] = None, first_frame: Optional[Union[None, SupportsIndex]] = None, last_frame: Optional[Union[None, SupportsIndex]] = None) -> None:
@@ -368,11 +365,11 @@ class PygameGIF:
 		warnings.warn("gif_pygame.PygameGIF.convert deprecated since 1.0.0, use gif_pygame.transform.convert instead", DeprecationWarning, 2)
 		selected_frames = self._grab_frame(select_frame, first_frame, last_frame)
 
-		for index, _ in enumerate(selected_frames):
-			self.frames[index][0] = self.frames[index][0].convert()
+		for frame in selected_frames:
+			frame[0] = frame[0].convert()
 
 			if colorkey != None:
-				self.frames[index][0].set_colorkey(colorkey)
+				frame[0].set_colorkey(colorkey)
 
 	def render(self, surface: pygame.Surface, dest: Union[_Coordinate, _CanBeRect]) -> None:
 		"""
@@ -425,15 +422,12 @@ class PygameGIF:
 			self.frames = []
 			for frame in range(self.gif.n_frames):
 				self.gif.seek(frame)
-				if frame == 0:
-					if "duration" in self.gif.info:
-						self.frames.append((pygame.image.load(self.filepath), self.gif.info["duration"]*.001))
-					else:
-						self.frames.append((pygame.image.load(self.filepath), 1))
-				else:
-					self.frames.append((pygame.image.frombytes(self.gif.tobytes(), self.gif.size, self.gif.mode), self.gif.info["duration"]*.001))
+				rgba = self.gif.convert("RGBA")
+				self.frames.append([pygame.image.frombytes(rgba.tobytes(), rgba.size, "RGBA"), self.gif.info.get("duration", 1000)*.001])
 
+			self._n_frames = self.gif.n_frames
 			self.gif.close()
+			del self.gif
 
 		self.frame = 0
 		self.frame_time = 0
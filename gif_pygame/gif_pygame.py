@@ -16,9 +16,18 @@ A tool to make loading animated image files in pygame easier
 	>>> surface.blit(loaded_gif.blit_ready(), (x, y)) # Animates the animated image and returns the current frame. Unlike `gif.render()`, this can be used with `surface.blit()`
 """
 
-import pygame, time, warnings
-
-from PIL import Image
+import pygame, os, time, warnings, hashlib, asyncio, operator
+
+from array import array
+from bisect import bisect_right
+from collections import Counter
+from collections.abc import MutableSequence
+from functools import partial
+from itertools import accumulate
+from queue import Queue, Full
+from threading import Thread, Event
+
+from PIL import Image, ImageSequence
 from typing import Union, Tuple, Sequence, SupportsIndex, Iterable, Optional
 
 from ._common import _Coordinate, _CanBeRect, _FileArg, _RgbaOutput, _ColorValue
@@ -33,10 +42,116 @@ except AttributeError:
 	warnings.warn("\nYour pygame version is not fully compatible with this module, so some functions may not run.\nPlease use pygame-ce for extra speed, better support, and better experience.\npip uninstall pygame\npip install pygame-ce", Warning, 2)
 	is_ce = False
 
+_warned = set()
+
+def _deprecate_once(name: str, message: str) -> None:
+	if name not in _warned:
+		_warned.add(name)
+		warnings.warn(message, DeprecationWarning, 3)
+
+def _frame_index(frame, n: int) -> Optional[int]:
+	# anything usable as a list index is accepted (e.g. numpy integers), returns None if it isn't one of the `n` frames
+	try:
+		frame = operator.index(frame)
+	except TypeError:
+		return None
+	return frame % n if -n <= frame < n else None
+
+class _Frame:
+	# a `[surface, duration]` pair that reads from and writes through to the gif's frame storage
+	__slots__ = ("_gif", "_index")
+
+	def __init__(self, gif: "GIFPygame", index: int) -> None:
+		self._gif = gif
+		self._index = index
+
+	def __getitem__(self, item):
+		return (self._gif._surfaces, self._gif._durations)[item][self._index]
+
+	def __setitem__(self, item, value):
+		gif = self._gif
+		gif._detach()
+		(gif._surfaces, gif._durations)[item][self._index] = value
+		gif._update_timeline()
+		gif._update_size()
+
+	def __len__(self):
+		return 2
+
+	def __iter__(self):
+		yield self[0]
+		yield self[1]
+
+	def __eq__(self, other):
+		return isinstance(other, (_Frame, list, tuple)) and list(self) == list(other)
+
+	def __repr__(self):
+		return repr(list(self))
+
+class _FrameList(MutableSequence):
+	# the `GIFPygame.frames` view, changes made through it update the gif
+	__slots__ = ("_gif",)
+
+	def __init__(self, gif: "GIFPygame") -> None:
+		self._gif = gif
+
+	def __getitem__(self, index):
+		if isinstance(index, slice):
+			return [_Frame(self._gif, i) for i in range(*index.indices(len(self)))]
+		return _Frame(self._gif, range(len(self))[index])
+
+	def __setitem__(self, index, frames):
+		gif = self._gif
+		gif._detach()
+		if isinstance(index, slice):
+			frames = [tuple(frame) for frame in frames]
+			gif._surfaces[index] = [frame[0] for frame in frames]
+			gif._durations[index] = array("d", [frame[1] for frame in frames])
+		else:
+			gif._surfaces[index], gif._durations[index] = frames
+		gif._update_timeline()
+		gif._update_size()
+
+	def __delitem__(self, index):
+		gif = self._gif
+		gif._detach()
+		del gif._surfaces[index]
+		del gif._durations[index]
+		gif._update_timeline()
+		gif._update_size()
+
+	def __len__(self):
+		return len(self._gif._surfaces)
+
+	def __eq__(self, other):
+		return isinstance(other, (_FrameList, list, tuple)) and list(self) == list(other)
+
+	def __repr__(self):
+		return repr(list(self))
+
+	def insert(self, index, frame):
+		gif = self._gif
+		gif._detach()
+		surface, duration = frame
+		gif._surfaces.insert(index, surface)
+		gif._durations.insert(index, duration)
+		gif._update_timeline()
+		gif._update_size()
+
+	def pop(self, index=-1):
+		frame = list(self[index])
+		del self[index]
+		return frame
+
+	def copy(self):
+		return [list(frame) for frame in self]
+
 class GIFPygame:
 	"""
 	The class responsible for handling all of the .gif file functions
 	"""
+	__slots__ = ("_surfaces", "_durations", "_orig_surfaces", "_orig_durations", "_cumulative", "_total", "_size", "_width", "_height", "frame", "start_time", "paused_time", "paused", "loops", "ended", "_pending_convert")
+
 	def __init__(self, frames: Iterable[Tuple[pygame.Surface, int]], loops: Optional[int]=-1) -> None:
 		"""
 		Creates a `GIFPygame` instance
@@ -45,66 +160,163 @@ class GIFPygame:
 		:param loops: (optional) The amount of loops the .gif will play until pausing. Use `-1` for infinite loops
 		"""
 		
-		self.orig_frames = frames.copy()
-		self.frames = frames.copy()
+		self.frames = frames
+		# the reset snapshot shares the frame storage until the first change, see `_detach()`
+		self._orig_surfaces = self._surfaces
+		self._orig_durations = self._durations
 		
 		self.frame = 0
-		self.frame_time = 0
+		self.start_time = 0
 		self.paused_time = 0
 		self.paused = False
 		self.loops = [0, loops]
 		self.ended = False
+		self._pending_convert = None
 
 	
-	def _animate(self):
-		if self.frame_time == 0:
-			self.frame_time = time.time()
-
-		if time.time()-self.frame_time >= self.frames[self.frame][1] and not self.paused and not self.ended:
-			if self.frame >= len(self.frames)-1:
-				self.loops[0] += 1
-			self.frame = self.frame + 1 if self.frame < len(self.frames)-1 else 0
-			self.frame_time = time.time()
-
-		
-		if self.loops[1] != -1 and self.loops[0] > self.loops[1]:
+	def _update_timeline(self):
+		# the timeline is kept in integer nanoseconds to match `time.monotonic_ns()`
+		self._cumulative = list(accumulate(round(duration*1e9) for duration in self._durations))
+		self._total = self._cumulative[-1] if self._cumulative else 0
+
+	def _update_size(self):
+		self._size = self._surfaces[0].get_size() if self._surfaces else (0, 0)
+		self._width, self._height = self._size
+
+	def _convert_pending(self):
+		# `load()` ran before the display mode was set, so the loaded frames are converted on the first render instead
+		# this is only tried once, if the display still isn't set the frames are left as they are
+		pending = self._pending_convert
+		self._pending_convert = None
+		if not pygame.display.get_init() or pygame.display.get_surface() is None:
+			return
+
+		# surfaces that were replaced since loading (e.g. by a transform) aren't in `pending` and are kept untouched
+		converted = {}
+		for surface in self._surfaces + self._orig_surfaces:
+			if surface in pending and surface not in converted:
+				converted[surface] = surface.convert_alpha() if pending[surface] else surface.convert()
+		surfaces = [converted.get(surface, surface) for surface in self._surfaces]
+		self._orig_surfaces = surfaces if self._orig_surfaces is self._surfaces else [converted.get(surface, surface) for surface in self._orig_surfaces]
+		self._surfaces = surfaces
+
+	def _step_frame(self, now):
+		# with no time between frames (e.g. all durations are 0) the timeline can't be used, so each call moves one frame instead
+		n = len(self._surfaces)
+		if not n:
+			return 0
+		frame = self.frame + 1
+		if frame >= n:
+			frame = 0
+			counter = self.loops
+			counter[0] += 1
+			if counter[1] != -1 and counter[0] > counter[1]:
+				self.ended = True
+				self.paused_time = now
+		self.frame = frame
+		return frame
+
+	def _animate(self, _monotonic=time.monotonic_ns):
+		if self._pending_convert is not None:
+			self._convert_pending()
+		if self.paused or self.ended:
+			return self.frame
+
+		now = _monotonic()
+		start_time = self.start_time
+		if start_time == 0:
+			self.start_time = start_time = now
+		total = self._total
+		if total <= 0:
+			return self._step_frame(now)
+
+		loops, elapsed = divmod(now-start_time, total)
+		counter = self.loops
+		counter[0] = loops
+		if counter[1] != -1 and loops > counter[1]:
 			self.ended = True
-			self.pause()
-			self.paused = False
+			self.paused_time = now
+			self.frame = 0
+			return self.frame
+
+		self.frame = bisect_right(self._cumulative, elapsed)
+		return self.frame
 
 	def _grab_frame(self, select_frame, first_frame, last_frame):
+		n = len(self._surfaces)
 		if select_frame is not None:
-			selected_frames = [self.frames[select_frame]]
-		else:
-			if first_frame is not None and last_frame is not None:
-				selected_frames = self.frames[first_frame:last_frame]
-			elif first_frame is not None and not last_frame:
-				selected_frames = self.frames[first_frame:]
-			elif not first_frame and last_frame is not None:
-				selected_frames = self.frames[:last_frame]
-			elif (not first_frame and not last_frame) or (0 < last_frame < first_frame):
-				selected_frames = self.frames
+			if select_frame < 0:
+				select_frame += n
+			return range(select_frame, select_frame+1)
+
+		return range(*slice(first_frame, last_frame).indices(n))
+
+	def _select_frames(self, frames):
+		n = len(self._surfaces)
+		selected_frames = []
+		skipped_frames = []
+		for frame in frames:
+			index = _frame_index(frame, n)
+			if index is not None:
+				selected_frames.append(index)
+			else:
+				skipped_frames.append(frame)
 
+		if skipped_frames:
+			warnings.warn(f"Indexes {skipped_frames} do not exist, so they were skipped", UserWarning, 3)
 		return selected_frames
 
+	def _detach(self):
+		# copies the frame storage away from the reset snapshot, must be called before changing it in place
+		if self._surfaces is self._orig_surfaces:
+			self._surfaces = self._surfaces.copy()
+		if self._durations is self._orig_durations:
+			self._durations = self._durations[:]
+
+	def _unshare(self, frames):
+		# identical frames share one surface, so it's copied before being changed in place
+		self._detach()
+		references = Counter(self._surfaces)
+		references.update(self._orig_surfaces)
+		for frame in frames:
+			surface = self._surfaces[frame]
+			if references[surface] > 1:
+				references[surface] -= 1
+				self._surfaces[frame] = surface.copy()
+
+
+	@property
+	def frames(self) -> MutableSequence:
+		"""
+		The frames of the animation as `[surface, duration]` pairs, changing them (e.g. `gif.frames[0][1] = 0.5` or `gif.frames.append([surface, 0.1])`) updates the animation
+		"""
+		return _FrameList(self)
+
+	@frames.setter
+	def frames(self, frames: Iterable[Tuple[pygame.Surface, float]]) -> None:
+		frames = list(frames)
+		self._surfaces = [frame[0] for frame in frames]
+		self._durations = array("d", [frame[1] for frame in frames])
+		self._update_timeline()
+		self._update_size()
 
 	def get_width(self) -> int:
 		"""
 		Returns the width of the .gif/.apng file
 		"""
-		return self.frames[0][0].get_width()
+		return self._width
 
 	def get_height(self) -> int:
 		"""
 		Returns the height of the .gif/.apng file
 		"""
-		return self.frames[0][0].get_height()
+		return self._height
 
 	def get_size(self) -> Tuple[int, int]:
 		"""
 		Returns the size of the .gif/.apng file
 		"""
-		return self.frames[0][0].get_size()
+		return self._size
 
 	def get_rect(self, **kwargs) -> pygame.Rect:
 		"""
@@ -112,26 +324,21 @@ class GIFPygame:
 
 		:param kwargs: (optional) The the keyword arguments that will be passed in to the `surface.get_rect()` function.
 		"""
-		return self.frames[0][0].get_rect(**kwargs)
+		rect = pygame.Rect((0, 0), self._size)
+		for attribute, value in kwargs.items():
+			setattr(rect, attribute, value)
+		return rect
 
-	def get_surfaces(self, frames: Optional[Iterable[int]]=[]) -> Sequence[pygame.Surface]:
+	def get_surfaces(self, frames: Iterable[int]=()) -> Sequence[pygame.Surface]:
 		"""
 		Returns the surface of the selected frame(s)
 		
 		:param frames: (optional) Get the surface of the selected frames, leave empty to get all of the surfaces
 		"""
-		if len(frames) == 0:
-			selected_frames = self.frames.copy()
-		else:
-			selected_frames = []
-			for frame in frames:
-				try:
-					selected_frames.append(self.frames[frame])
-				except IndexError:
-					print(f"Index {frame} does not exist, so it will be skipped")
+		if not frames:
+			return self._surfaces.copy()
 
-		l = [frame[0] for frame in selected_frames]
-		return l
+		return list(map(self._surfaces.__getitem__, self._select_frames(frames)))
 
 	def set_surface(self, surfaces: Iterable[Tuple[pygame.Surface, int]]) -> None:
 		"""
@@ -143,58 +350,46 @@ class GIFPygame:
 
 		:raises IndexError: all of the given frame numbers given aren't an index of the frames list
 		"""
-		warnings.warn("gif_pygame.GIFPygame.set_surface deprecated since 1.0.0, use gif_pygame.transform.surfaces instead", DeprecationWarning, 2)
+		_deprecate_once("set_surface", "gif_pygame.GIFPygame.set_surface deprecated since 1.0.0, use gif_pygame.transform.surfaces instead")
+		self._detach()
+		n = len(self._surfaces)
 		failed_frames = []
 		duplicated_frames = []
-		successful_frames = []
+		seen_frames = set()
 
 		for index, surface in enumerate(surfaces):
-			try:
-				self.frames[surface[1]]
-			except:
+			frame = _frame_index(surface[1], n)
+			if frame is None:
 				failed_frames.append((index, surface[1]))
 				continue
 
-			if surface in successful_frames:
-				duplicated_frames.append((index, surface[1]))
+			if frame in seen_frames:
+				duplicated_frames.append((index, frame))
 				continue
 
 			else:
-				successful_frames.append(surface)
-				self.frames[surface[1]][0] = surface[0]
+				seen_frames.add(frame)
+				self._surfaces[frame] = surface[0]
+		self._update_size()
 
-		if len(successful_frames) == 0:
+		if not seen_frames:
 			raise IndexError("None of the given frames are in the frames list")
 		else:
 			if len(failed_frames):
-				failed_str = "There were some failed frames, they were:\n"
-				for failed_frame in failed_frames:
-					failed_str += f"Frame Number: {failed_frame[1]}, Index: {failed_frame[0]}"
-				print(failed_str)
+				warnings.warn("There were some failed frames, they were:\n" + "\n".join(f"Frame Number: {frame}, Index: {index}" for index, frame in failed_frames), UserWarning, 2)
 			if len(duplicated_frames):
-				duplicated_str = "There were some duplicated frames, they were:\n"
-				for duplicated_frame in duplicated_frames:
-					duplicated_str += f"Frame Number: {duplicated_frame[1]}, Index: {duplicated_frame[0]}"
-				print(duplicated_str)
+				warnings.warn("There were some duplicated frames, they were:\n" + "\n".join(f"Frame Number: {frame}, Index: {index}" for index, frame in duplicated_frames), UserWarning, 2)
 
-	def get_durations(self, frames: Optional[Iterable[int]]=[]) -> Sequence[float]:
+	def get_durations(self, frames: Iterable[int]=()) -> Sequence[float]:
 		"""
 		Returns the duration of the selected frame(s)
 		
 		:param frames: (optional) Get the surface of the selected frames, leave empty to get all of the durations
 		"""
-		if len(frames) == 0:
-			selected_frames = self.frames.copy()
-		else:
-			selected_frames = []
-			for frame in frames:
-				try:
-					selected_frames.append(self.frames[frame])
-				except IndexError:
-					print(f"Index {frame} does not exist, so it will be skipped")
+		if not frames:
+			return self._durations.tolist()
 
-		l = [frame[1] for frame in selected_frames]
-		return l
+		return list(map(self._durations.__getitem__, self._select_frames(frames)))
 
 	def set_duration(self, durations: Iterable[Tuple[float, int]]) -> None:
 		"""
@@ -206,58 +401,46 @@ class GIFPygame:
 
 		:raises IndexError: all of the given frame numbers given aren't an index of the frames list
 		"""
-		warnings.warn("gif_pygame.GIFPygame.set_duration deprecated since 1.0.0, use gif_pygame.transform.durations instead", DeprecationWarning, 2)
+		_deprecate_once("set_duration", "gif_pygame.GIFPygame.set_duration deprecated since 1.0.0, use gif_pygame.transform.durations instead")
+		self._detach()
+		n = len(self._surfaces)
 		failed_frames = []
 		duplicated_frames = []
-		successful_frames = []
+		seen_frames = set()
 
 		for index, duration in enumerate(durations):
-			try:
-				self.frames[duration[1]]
-			except:
+			frame = _frame_index(duration[1], n)
+			if frame is None:
 				failed_frames.append((index, duration[1]))
 				continue
 
-			if duration in successful_frames:
-				duplicated_frames.append((index, duration[1]))
+			if frame in seen_frames:
+				duplicated_frames.append((index, frame))
 				continue
 
 			else:
-				successful_frames.append(duration)
-				self.frames[duration[1]][1] = duration[0]
+				seen_frames.add(frame)
+				self._durations[frame] = duration[0]
+		self._update_timeline()
 
-		if len(successful_frames) == 0:
+		if not seen_frames:
 			raise IndexError("None of the given frames are in the frames list")
 		else:
 			if len(failed_frames):
-				failed_str = "There were some failed frames, they were:\n"
-				for failed_frame in failed_frames:
-					failed_str += f"Frame Number: {failed_frame[1]}, Index: {failed_frame[0]}"
-				print(failed_str)
+				warnings.warn("There were some failed frames, they were:\n" + "\n".join(f"Frame Number: {frame}, Index: {index}" for index, frame in failed_frames), UserWarning, 2)
 			if len(duplicated_frames):
-				duplicated_str = "There were some duplicated frames, they were:\n"
-				for duplicated_frame in duplicated_frames:
-					duplicated_str += f"Frame Number: {duplicated_frame[1]}, Index: {duplicated_frame[0]}"
-				print(duplicated_str)
+				warnings.warn("There were some duplicated frames, they were:\n" + "\n".join(f"Frame Number: {frame}, Index: {index}" for index, frame in duplicated_frames), UserWarning, 2)
 
-	def get_datas(self, frames: Optional[Iterable[int]]=[]) -> Sequence[Tuple[pygame.Surface, float]]:
+	def get_datas(self, frames: Iterable[int]=()) -> Sequence[Tuple[pygame.Surface, float]]:
 		"""
 		Returns both the surface and the duration of the selected frame(s)
 		
 		:param frames: (optional) Get the surface of the selected frames, leave empty to get the surface and duration of all of the frames
 		"""
-		if len(frames) == 0:
-			selected_frames = self.frames.copy()
-		else:
-			selected_frames = []
-			for frame in frames:
-				try:
-					selected_frames.append(self.frames[frame])
-				except IndexError:
-					print(f"Index {frame} does not exist, so it will be skipped")
+		if not frames:
+			return list(zip(self._surfaces, self._durations))
 
-		l = [frame for frame in selected_frames]
-		return l
+		return [(self._surfaces[frame], self._durations[frame]) for frame in self._select_frames(frames)]
 
 	def set_data(self, datas: Iterable[Tuple[pygame.Surface, float, int]]) -> None:
 		"""
@@ -269,59 +452,48 @@ class GIFPygame:
 
 		:raises IndexError: all of the given frame numbers given aren't an index of the frames list
 		"""
-		warnings.warn("gif_pygame.GIFPygame.set_data deprecated since 1.0.0, use gif_pygame.transform.datas instead", DeprecationWarning, 2)
+		_deprecate_once("set_data", "gif_pygame.GIFPygame.set_data deprecated since 1.0.0, use gif_pygame.transform.datas instead")
+		self._detach()
+		n = len(self._surfaces)
 		failed_frames = []
 		duplicated_frames = []
-		successful_frames = []
+		seen_frames = set()
 
 		for index, data in enumerate(datas):
-			try:
-				self.frames[data[2]]
-			except:
+			frame = _frame_index(data[2], n)
+			if frame is None:
 				failed_frames.append((index, data[2]))
 				continue
 
-			if data in successful_frames:
-				duplicated_frames.append((index, data[2]))
+			if frame in seen_frames:
+				duplicated_frames.append((index, frame))
 				continue
 
 			else:
-				successful_frames.append(data)
-				self.frames[data[2]][0] = data[0]
-				self.frames[data[2]][1] = data[1]
+				seen_frames.add(frame)
+				self._surfaces[frame] = data[0]
+				self._durations[frame] = data[1]
+		self._update_timeline()
+		self._update_size()
 
-		if len(successful_frames) == 0:
+		if not seen_frames:
 			raise IndexError("None of the given frames are in the frames list")
 		else:
 			if len(failed_frames):
-				failed_str = "There were some failed frames, they were:\n"
-				for failed_frame in failed_frames:
-					failed_str += f"Frame Number: {failed_frame[1]}, Index: {failed_frame[0]}"
-				print(failed_str)
+				warnings.warn("There were some failed frames, they were:\n" + "\n".join(f"Frame Number: {frame}, Index: {index}" for index, frame in failed_frames), UserWarning, 2)
 			if len(duplicated_frames):
-				duplicated_str = "There were some duplicated frames, they were:\n"
-				for duplicated_frame in duplicated_frames:
-					duplicated_str += f"Frame Number: {duplicated_frame[1]}, Index: {duplicated_frame[0]}"
-				print(duplicated_str)
+				warnings.warn("There were some duplicated frames, they were:\n" + "\n".join(f"Frame Number: {frame}, Index: {index}" for index, frame in duplicated_frames), UserWarning, 2)
 
-	def get_alphas(self, frames: Optional[Iterable[int]]=[]) -> Sequence[int]:
+	def get_alphas(self, frames: Iterable[int]=()) -> Sequence[int]:
 		"""
 		Returns the alpha of the selected frame(s)
 		
 		:param frames: (optional) Get the surface of the selected frames, leave empty to get all of the alphas
 		"""
-		if len(frames) == 0:
-			selected_frames = self.frames.copy()
-		else:
-			selected_frames = []
-			for frame in frames:
-				try:
-					selected_frames.append(self.frames[frame])
-				except IndexError:
-					print(f"Index {frame} does not exist, so it will be skipped")
+		if not frames:
+			return list(map(pygame.Surface.get_alpha, self._surfaces))
 
-		l = [frame[0].get_alpha() for frame in selected_frames]
-		return l
+		return list(map(pygame.Surface.get_alpha, map(self._surfaces.__getitem__, self._select_frames(frames))))
 
 	def set_alpha(self, alpha: int, select_frame: Optional[Union[None, SupportsIndex]] = None, first_frame: Optional[Union[None, SupportsIndex]] = None, last_frame: Optional[Union[None, SupportsIndex]] = None) -> None:
 		"""
@@ -334,11 +506,11 @@ class GIFPygame:
 
 		Leave everything (except `alpha`) as `None` to set the `alpha` all of the frames
 		"""
-		warnings.warn("gif_pygame.GIFPygame.set_alpha deprecated since 1.0.0, use gif_pygame.transform.alphas instead", DeprecationWarning, 2)
+		_deprecate_once("set_alpha", "gif_pygame.GIFPygame.set_alpha deprecated since 1.0.0, use gif_pygame.transform.alphas instead")
 		selected_frames = self._grab_frame(select_frame, first_frame, last_frame)
-
-		for index, _ in enumerate(selected_frames):
-			self.frames[index][0].set_alpha(alpha)
+		self._unshare(selected_frames)
+		for index in selected_frames:
+			self._surfaces[index].set_alpha(alpha)
 
 
 	def convert(self, colorkey: Optional[Union[None, _ColorValue]] = None, select_frame: Optional[Union[None, SupportsIndex]] = None, first_frame: Optional[Union[None, SupportsIndex]] = None, last_frame: Optional[Union[None, SupportsIndex]] = None) -> None:
@@ -347,49 +519,97 @@ class GIFPygame:
 
 		:param colorkey: (optional) sets the colorkey of the frames, type `None` in order to not set a colorkey
 		"""
-		warnings.warn("gif_pygame.GIFPygame.convert deprecated since 1.0.0, use gif_pygame.transform.convert instead", DeprecationWarning, 2)
-		selected_frames = self._grab_frame(select_frame, first_frame, last_frame)
-
-		for index, _ in enumerate(selected_frames):
-			self.frames[index][0] = self.frames[index][0].convert()
+		_deprecate_once("convert", "gif_pygame.GIFPygame.convert deprecated since 1.0.0, use gif_pygame.transform.convert instead")
+		self._detach()
+		for index in self._grab_frame(select_frame, first_frame, last_frame):
+			self._surfaces[index] = self._surfaces[index].convert()
 
 			if colorkey != None:
-				self.frames[index][0].set_colorkey(colorkey)
+				self._surfaces[index].set_colorkey(colorkey)
 
-	def render(self, surface: pygame.Surface, dest: Union[_Coordinate, _CanBeRect]) -> None:
+	def render(self, surface: pygame.Surface, dest: Union[_Coordinate, _CanBeRect], _monotonic=time.monotonic_ns, _bisect_right=bisect_right) -> None:
 		"""
 		Renders and animates the .gif file
 
 		:param surface: The surface you want to render the animation at
 		:param dest: Where the animation will be rendered at relative to the given surface
 		"""
-		self._animate()
-		surface.blit(self.frames[self.frame][0], dest)
+		# `_animate` inlined, as this runs every frame for every rendered gif
+		if self._pending_convert is not None:
+			self._convert_pending()
+		frame = self.frame
+		if not self.paused and not self.ended:
+			now = _monotonic()
+			start_time = self.start_time
+			if start_time == 0:
+				self.start_time = start_time = now
+
+			total = self._total
+			if total > 0:
+				loops, elapsed = divmod(now-start_time, total)
+				counter = self.loops
+				counter[0] = loops
+				if counter[1] != -1 and loops > counter[1]:
+					self.ended = True
+					self.paused_time = now
+					frame = 0
+				else:
+					frame = _bisect_right(self._cumulative, elapsed)
+				self.frame = frame
+			else:
+				frame = self._step_frame(now)
 
-	def blit_ready(self) -> pygame.Surface:
+		surface.blit(self._surfaces[frame], dest)
+
+	def render_batch(self, surface: pygame.Surface, dests: Iterable[Union[_Coordinate, _CanBeRect]], blend_flag: Optional[int]=0) -> None:
 		"""
-		Animates the .gif file and returns the current frame. Best used with `surface.blit()` function
+		Renders and animates the .gif file at many positions with a single batched blit. Faster than calling `render()` for each position, since the same frame is drawn every time
 
 		:param surface: The surface you want to render the animation at
-		:param dest: Where the animation will be rendered at relative to the given surface
+		:param dests: Where the animation will be rendered at relative to the given surface, one for each copy
+		:param blend_flag: (optional) The blend flag used for every blit
+		"""
+		source = self._surfaces[self._animate()]
+		if is_ce:
+			surface.fblits([(source, dest) for dest in dests], blend_flag)
+		else:
+			surface.blits([(source, dest, None, blend_flag) for dest in dests], False)
+
+	@staticmethod
+	def render_many(surface: pygame.Surface, gifs: Iterable[Tuple["GIFPygame", Union[_Coordinate, _CanBeRect]]], blend_flag: Optional[int]=0) -> None:
+		"""
+		Renders and animates many .gif files with a single batched blit
+
+		:param surface: The surface you want to render the animations at
+		:param gifs: An iterable with a tuple inside containing the gif and where it will be rendered at relative to the given surface
+		:param blend_flag: (optional) The blend flag used for every blit
+		"""
+		blit_sequence = [(gif._surfaces[gif._animate()], dest) for gif, dest in gifs]
+		if is_ce:
+			surface.fblits(blit_sequence, blend_flag)
+		else:
+			surface.blits([(source, dest, None, blend_flag) for source, dest in blit_sequence], False)
+
+	def blit_ready(self) -> pygame.Surface:
+		"""
+		Animates the .gif file and returns the current frame. Best used with `surface.blit()` function
 		"""
-		self._animate()
-		return self.get_surfaces([self.frame])[0]
+		return self._surfaces[self._animate()]
 
 	def pause(self) -> None:
 		"""
 		Pauses the animation
 		"""
-		if not self.paused:
-			self.paused_time = self.frame_time
+		if not self.paused and not self.ended:
+			self.paused_time = time.monotonic_ns()
 		self.paused = True
 
 	def unpause(self) -> None:
 		"""
 		Continues the animation
 		"""
-		if self.paused or self.ended:
-			self.frame_time = time.time()-(time.time()-self.paused_time)
+		if (self.paused or self.ended) and self.start_time:
+			self.start_time += time.monotonic_ns()-self.paused_time
 		self.paused = False
 		self.ended = False
 
@@ -402,43 +622,128 @@ class GIFPygame:
 		Leave `full_reset` as `None` to keep the current data, only restart the animation from frame 0
 		"""
 		if full_reset:
-			self.frames = self.orig_frames.copy()
+			self._surfaces = self._orig_surfaces
+			self._durations = self._orig_durations
+			self._update_timeline()
+			self._update_size()
 
 		self.frame = 0
-		self.frame_time = 0
+		self.start_time = 0
 		self.paused_time = 0
 		self.paused = False
+		self.ended = False
+		self.loops[0] = 0
 
 	def copy(self):
 		"""
 		Returns a copy of the gif
 		"""
-		return GIFPygame([(frame[0].copy(), frame[1]) for frame in self.frames], self.loops)
+		return GIFPygame([(surface.copy(), duration) for surface, duration in zip(self._surfaces, self._durations)], self.loops[1])
 
 class PygameGIF(GIFPygame):
+	__slots__ = ()
+
 	def __init__(self, frames: Iterable[Tuple[pygame.Surface, int]], loops: int | None = -1) -> None:
-		warnings.warn("gif_pygame.PygameGIF deprecated since 1.1.0, use gif_pygame.GIFPygame instead", DeprecationWarning, 2)
+		_deprecate_once("PygameGIF", "gif_pygame.PygameGIF deprecated since 1.1.0, use gif_pygame.GIFPygame instead")
 		super().__init__(frames, loops)
 
-def load(filepath: _FileArg, loops: Optional[int]=-1) -> GIFPygame:
+render_many = GIFPygame.render_many
+
+def _frame_duration(delay: Optional[int]) -> float:
+	# missing delays and delays of 10ms or less are shown for 100ms, like browsers do
+	return delay*.001 if delay and delay > 10 else .1
+
+def _decode_frames(gif: Image.Image, frame_queue: Queue, stop: Event) -> None:
+	def put(item):
+		# gives up once `load()` stops consuming, instead of blocking on a full queue forever
+		while not stop.is_set():
+			try:
+				frame_queue.put(item, timeout=.05)
+				return True
+			except Full:
+				pass
+		return False
+
+	decoded = 0
+	try:
+		for frame in ImageSequence.Iterator(gif):
+			rgba = frame.convert("RGBA")
+			data = rgba.tobytes()
+			if not put((data, hashlib.blake2b(data, digest_size=16).digest(), rgba.size, "A" in frame.mode or "transparency" in frame.info, _frame_duration(frame.info.get("duration")))):
+				return
+			decoded += 1
+	except Exception as error:
+		# a truncated file keeps the frames decoded so far instead of failing
+		if not decoded or not isinstance(error, (OSError, EOFError)):
+			put(error)
+	put(None)
+
+def _load_animation(filepath: _FileArg):
+	for surface, delay in pygame.image.load_animation(filepath):
+		yield (surface, hashlib.blake2b(surface.get_view("1"), digest_size=16).digest(), surface.get_size(), bool(surface.get_flags() & pygame.SRCALPHA), _frame_duration(delay))
+
+def load(filepath: _FileArg, loops: Optional[int]=-1, pre_convert: Optional[bool]=True, sdl_decode: Optional[bool]=False) -> GIFPygame:
 	"""
 	Loads the .gif file
 
 	:param filepath: The path of the .gif/.apng file that you want to load
 	:param loops: The amount of loops the .gif will play until pausing. Use `-1` for infinite loops
+	:param pre_convert: (optional) Converts the frames to the display's pixel format while loading, if the display mode hasn't been set yet they are converted on the first render instead, as long as the display mode is set by then
+	:param sdl_decode: (optional) Decodes .gif files with SDL_image instead of Pillow. Faster, but SDL_image keeps a transparent color after a later frame turns it off, so some .gif files render with holes, and truncated files keep a different number of frames
 	"""
-	gif = Image.open(filepath)
 	frames = []
-
-	for frame in range(gif.n_frames):
-		gif.seek(frame)
-		if frame == 0:
-			if "duration" in gif.info:
-				frames.append([pygame.image.load(filepath), gif.info["duration"]*.001])
-			else:
-				frames.append([pygame.image.load(filepath), 1])
+	loaded_surfaces = {}
+	pending_convert = {}
+	display_ready = pre_convert and pygame.display.get_init() and pygame.display.get_surface() is not None
+
+	with Image.open(filepath) as gif:
+		decoder = None
+		if sdl_decode and gif.format == "GIF" and hasattr(pygame.image, "load_animation") and isinstance(filepath, (str, os.PathLike)):
+			# SDL_image decodes the whole gif in C, Pillow is only used to detect the format
+			decoded_frames = _load_animation(filepath)
 		else:
-			frames.append([pygame.image.frombytes(gif.tobytes(), gif.size, gif.mode), gif.info["duration"]*.001])
-	gif.close()
-	
-	return GIFPygame(frames, loops)
+			# Pillow decodes the next frames in the background while the surfaces are being built
+			frame_queue = Queue(maxsize=4)
+			stop = Event()
+			decoder = Thread(target=_decode_frames, args=(gif, frame_queue, stop), daemon=True)
+			decoder.start()
+			decoded_frames = iter(frame_queue.get, None)
+
+		try:
+			for decoded in decoded_frames:
+				if isinstance(decoded, Exception):
+					raise decoded
+
+				data, digest, size, has_alpha, duration = decoded
+				# frames with identical pixels (e.g. idle loops) reuse the same surface
+				key = (digest, size, has_alpha)
+				surface = loaded_surfaces.get(key)
+				if surface is None:
+					surface = data if isinstance(data, pygame.Surface) else pygame.image.frombuffer(data, size, "RGBA")
+					if display_ready:
+						surface = surface.convert_alpha() if has_alpha else surface.convert()
+					elif pre_convert:
+						pending_convert[surface] = has_alpha
+					loaded_surfaces[key] = surface
+				frames.append([surface, duration])
+		finally:
+			if decoder is not None:
+				# the decoder must be done with the image before it's closed
+				stop.set()
+				decoder.join()
+
+	gif = GIFPygame(frames, loops)
+	if pending_convert:
+		gif._pending_convert = pending_convert
+	return gif
+
+async def load_async(filepath: _FileArg, loops: Optional[int]=-1, pre_convert: Optional[bool]=True, sdl_decode: Optional[bool]=False) -> GIFPygame:
+	"""
+	Loads the .gif file in a background thread, so the event loop can keep running while it loads
+
+	:param filepath: The path of the .gif/.apng file that you want to load
+	:param loops: The amount of loops the .gif will play until pausing. Use `-1` for infinite loops
+	:param pre_convert: (optional) Converts the frames to the display's pixel format while loading, if the display mode hasn't been set yet they are converted on the first render instead, as long as the display mode is set by then
+	:param sdl_decode: (optional) Decodes .gif files with SDL_image instead of Pillow. Faster, but SDL_image keeps a transparent color after a later frame turns it off, so some .gif files render with holes, and truncated files keep a different number of frames
+	"""
+	return await asyncio.get_running_loop().run_in_executor(None, partial(load, filepath, loops, pre_convert, sdl_decode))
@@ -4,15 +4,99 @@
 allows for easy gif tranformation
 """
 
-import pygame, warnings
+import pygame, os, math, warnings
 
-from typing import Union, Tuple, Sequence, Iterable, Optional
-from gif_pygame.gif_pygame import GIFPygame, is_ce
+from concurrent.futures import ThreadPoolExecutor
+from PIL import Image, ImageFilter
+
+from typing import Union, Tuple, Sequence, Iterable, Optional, Callable
+from gif_pygame.gif_pygame import GIFPygame, is_ce, _frame_index
 
 from ._common import _Coordinate, _ColorValue
 
 
-def flip(gif: GIFPygame, flip_x: bool, flip_y: bool, frames: Optional[Iterable[int]]=[]):
+_pool = None
+# on a single cpu the frames can't run side by side, so the pool would only add overhead
+_multicore = (os.cpu_count() or 1) >= 2
+
+def _get_pool() -> ThreadPoolExecutor:
+    global _pool
+    if _pool is None:
+        _pool = ThreadPoolExecutor(max_workers=os.cpu_count() or 2)
+    return _pool
+
+def _apply_transform(gif: GIFPygame, function: Callable[[pygame.Surface], pygame.Surface], frames: Iterable[int], parallel: bool=False):
+    gif._detach()
+    surfs = gif._surfaces
+    indexes = list(frames) if frames else range(len(surfs))
+    # frames sharing a surface are only transformed once
+    sources = [surfs[i] for i in indexes]
+    unique = list(dict.fromkeys(sources))
+    if parallel and _multicore and len(unique) >= 4 and gif._width*gif._height >= 64*64:
+        # these pygame transforms release the GIL, so the frames are transformed side by side
+        transformed = dict(zip(unique, _get_pool().map(function, unique)))
+    else:
+        transformed = {surf: function(surf) for surf in unique}
+    for i, surf in zip(indexes, sources):
+        surfs[i] = transformed[surf]
+    gif._update_size()
+
+def _apply_in_place(gif: GIFPygame, function: Callable[[pygame.Surface, pygame.Surface], pygame.Surface], frames: Iterable[int], parallel: bool=False):
+    # for pygame-ce transforms that take a `dest_surface`, the result is written over the frame instead of a new surface
+    indexes = list(frames) if frames else range(len(gif._surfaces))
+    gif._unshare(indexes)
+    unique = list(dict.fromkeys(gif._surfaces[i] for i in indexes))
+    if parallel and _multicore and len(unique) >= 4 and gif._width*gif._height >= 64*64:
+        list(_get_pool().map(lambda surf: function(surf, surf), unique))
+    else:
+        for surf in unique:
+            function(surf, surf)
+
+def _invert(surf: pygame.Surface) -> pygame.Surface:
+    # pygame.transform.invert only exists on pygame-ce, this gives the same result with blend blits
+    inverted = surf.copy()
+    inverted.fill((255, 255, 255))
+    inverted.blit(surf, (0, 0), special_flags=pygame.BLEND_RGB_SUB)
+    if surf.get_flags() & pygame.SRCALPHA:
+        alpha = surf.copy()
+        alpha.fill((255, 255, 255, 0), special_flags=pygame.BLEND_RGBA_MAX)
+        inverted.blit(alpha, (0, 0), special_flags=pygame.BLEND_RGBA_MIN)
+    return inverted
+
+def _grayscale(surf: pygame.Surface) -> pygame.Surface:
+    # pygame.transform.grayscale is missing from older pygame versions, Pillow uses the same luma weights
+    image = Image.frombytes("RGBA", surf.get_size(), pygame.image.tobytes(surf, "RGBA")).convert("LA").convert("RGBA")
+    return pygame.image.frombytes(image.tobytes(), image.size, "RGBA")
+
+def _box_radii(sigma: float, passes: int=3) -> Sequence[int]:
+    # box sizes whose successive blurs add up to a gaussian with the given standard deviation
+    ideal = math.sqrt(12*sigma*sigma/passes + 1)
+    lower = int(ideal)
+    if lower % 2 == 0:
+        lower -= 1
+    upper = lower + 2
+    lower_passes = round((12*sigma*sigma - passes*lower*lower - 4*passes*lower - 3*passes)/(-4*lower - 4))
+    return [(lower-1)//2 if i < lower_passes else (upper-1)//2 for i in range(passes)]
+
+def _fast_gaussian_blur(surf: pygame.Surface, radii: Sequence[int], repeat_edged_pixels: bool) -> pygame.Surface:
+    for radius in radii:
+        surf = pygame.transform.box_blur(surf, radius, repeat_edged_pixels)
+    return surf
+
+def _pillow_blur(surf: pygame.Surface, image_filter: ImageFilter.Filter, radius: int, repeat_edged_pixels: bool) -> pygame.Surface:
+    # pygame.transform.box_blur and gaussian_blur only exist on pygame-ce, Pillow's blur filters give about the same result
+    image = Image.frombytes("RGBA", surf.get_size(), pygame.image.tobytes(surf, "RGBA"))
+    if repeat_edged_pixels:
+        image = image.filter(image_filter)
+    else:
+        # Pillow always repeats the edge pixels, so the image is padded with transparent pixels first
+        padding = radius*3
+        padded = Image.new("RGBA", (image.width + padding*2, image.height + padding*2))
+        padded.paste(image, (padding, padding))
+        image = padded.filter(image_filter).crop((padding, padding, padding + image.width, padding + image.height))
+    return pygame.image.frombytes(image.tobytes(), image.size, "RGBA")
+
+def flip(gif: GIFPygame, flip_x: bool, flip_y: bool, frames: Iterable[int]=(), parallel: Optional[bool]=False):
     """
     flip vertically and horizontally
 
@@ -20,68 +104,44 @@ def flip(gif: GIFPygame, flip_x: bool, flip_y: bool, frames: Optional[Iterable[i
     :param flip_x: flip horizontally
     :param flip_y: flip vertically
     :param frames: (optional) choose the frames where the transformation will take affect. Leave empty to transform the entire gif
+    :param parallel: (optional) transform the frames on a thread pool, only used for gifs with at least 4 frames of 64x64 pixels or more. Off by default, as flipping is mostly copying memory and gains nothing from threads
     """
-    old_surfs = gif.get_surfaces(frames)
-    if not frames:
-        frames = [i for i in range(len(gif.frames))]
-    new_surfs = []
+    _apply_transform(gif, lambda surf: pygame.transform.flip(surf, flip_x, flip_y), frames, parallel)
 
-    for i, surf in enumerate(old_surfs):
-        new_surfs.append((pygame.transform.flip(surf, flip_x, flip_y), frames[i]))
-    surfaces(gif, new_surfs)
-
-def scale(gif: GIFPygame, size: _Coordinate, frames: Optional[Iterable[int]]=[]):
+def scale(gif: GIFPygame, size: _Coordinate, frames: Iterable[int]=(), parallel: Optional[bool]=True):
     """
     resize to new resolution
 
     :param gif: the gif that you want to tranform
     :param size: width and height of the new resolution
     :param frames: (optional) choose the frames where the transformation will take affect. Leave empty to transform the entire gif
+    :param parallel: (optional) transform the frames on a thread pool, only used for gifs with at least 4 frames of 64x64 pixels or more
     """
-    old_surfs = gif.get_surfaces(frames)
-    if not frames:
-        frames = [i for i in range(len(gif.frames))]
-    new_surfs = []
-
-    for i, surf in enumerate(old_surfs):
-        new_surfs.append((pygame.transform.scale(surf, size), frames[i]))
-    surfaces(gif, new_surfs)
+    _apply_transform(gif, lambda surf: pygame.transform.scale(surf, size), frames, parallel)
 
-def scale_by(gif: GIFPygame, factor: Union[float, Sequence[float]], frames: Optional[Iterable[int]]=[]):
+def scale_by(gif: GIFPygame, factor: Union[float, Sequence[float]], frames: Iterable[int]=(), parallel: Optional[bool]=True):
     """
     resize to new resolution, using scalar(s)
 
     :param gif: the gif that you want to tranform
     :param factor: the factor of resizing
     :param frames: (optional) choose the frames where the transformation will take affect. Leave empty to transform the entire gif
+    :param parallel: (optional) transform the frames on a thread pool, only used for gifs with at least 4 frames of 64x64 pixels or more
     """
-    old_surfs = gif.get_surfaces(frames)
-    if not frames:
-        frames = [i for i in range(len(gif.frames))]
-    new_surfs = []
+    _apply_transform(gif, lambda surf: pygame.transform.scale_by(surf, factor), frames, parallel)
 
-    for i, surf in enumerate(old_surfs):
-        new_surfs.append((pygame.transform.scale_by(surf, factor), frames[i]))
-    surfaces(gif, new_surfs)
-
-def rotate(gif: GIFPygame, angle: float, frames: Optional[Iterable[int]]=[]):
+def rotate(gif: GIFPygame, angle: float, frames: Iterable[int]=(), parallel: Optional[bool]=True):
     """
     rotate the gif
 
     :param gif: the gif that you want to tranform
     :param angle: the rotation angle
     :param frames: (optional) choose the frames where the transformation will take affect. Leave empty to transform the entire gif
+    :param parallel: (optional) transform the frames on a thread pool, only used for gifs with at least 4 frames of 64x64 pixels or more
     """
-    old_surfs = gif.get_surfaces(frames)
-    if not frames:
-        frames = [i for i in range(len(gif.frames))]
-    new_surfs = []
-
-    for i, surf in enumerate(old_surfs):
-        new_surfs.append((pygame.transform.rotate(surf, angle), frames[i]))
-    surfaces(gif, new_surfs)
+    _apply_transform(gif, lambda surf: pygame.transform.rotate(surf, angle), frames, parallel)
     
-def rotozoom(gif: GIFPygame, angle: int, scale: float, frames: Optional[Iterable[int]]=[]):
+def rotozoom(gif: GIFPygame, angle: int, scale: float, frames: Iterable[int]=(), parallel: Optional[bool]=True):
     """
     filtered scale and rotation
 
@@ -89,67 +149,69 @@ def rotozoom(gif: GIFPygame, angle: int, scale: float, frames: Optional[Iterable
     :param angle: the rotation angle
     :param scale: width and height of the new resolution
     :param frames: (optional) choose the frames where the transformation will take affect. Leave empty to transform the entire gif
+    :param parallel: (optional) transform the frames on a thread pool, only used for gifs with at least 4 frames of 64x64 pixels or more
     """
-    old_surfs = gif.get_surfaces(frames)
-    if not frames:
-        frames = [i for i in range(len(gif.frames))]
-    new_surfs = []
-
-    for i, surf in enumerate(old_surfs):
-        new_surfs.append((pygame.transform.rotozoom(surf, angle, scale), frames[i]))
-    surfaces(gif, new_surfs)
+    _apply_transform(gif, lambda surf: pygame.transform.rotozoom(surf, angle, scale), frames, parallel)
     
-def scale2x(gif: GIFPygame, frames: Optional[Iterable[int]]=[]):
+def scale2x(gif: GIFPygame, frames: Iterable[int]=(), parallel: Optional[bool]=True):
     """
     specialized gif frames doubler
 
     :param gif: the gif that you want to tranform
     :param frames: (optional) choose the frames where the transformation will take affect. Leave empty to transform the entire gif
+    :param parallel: (optional) transform the frames on a thread pool, only used for gifs with at least 4 frames of 64x64 pixels or more
     """
-    old_surfs = gif.get_surfaces(frames)
-    if not frames:
-        frames = [i for i in range(len(gif.frames))]
-    new_surfs = []
-
-    for i, surf in enumerate(old_surfs):
-        new_surfs.append((pygame.transform.scale2x(surf), frames[i]))
-    surfaces(gif, new_surfs)
+    _apply_transform(gif, lambda surf: pygame.transform.scale2x(surf), frames, parallel)
     
-def smoothscale(gif: GIFPygame, size: _Coordinate, frames: Optional[Iterable[int]]=[]):
+def smoothscale(gif: GIFPygame, size: _Coordinate, frames: Iterable[int]=(), parallel: Optional[bool]=True):
     """
     scale a gif to an arbitrary size smoothly
 
     :param gif: the gif that you want to tranform
     :param size: width and height of the new size
     :param frames: (optional) choose the frames where the transformation will take affect. Leave empty to transform the entire gif
+    :param parallel: (optional) transform the frames on a thread pool, only used for gifs with at least 4 frames of 64x64 pixels or more
     """
-    old_surfs = gif.get_surfaces(frames)
-    if not frames:
-        frames = [i for i in range(len(gif.frames))]
-    new_surfs = []
-
-    for i, surf in enumerate(old_surfs):
-        new_surfs.append((pygame.transform.smoothscale(surf, size), frames[i]))
-    surfaces(gif, new_surfs)
+    _apply_transform(gif, lambda surf: pygame.transform.smoothscale(surf, size), frames, parallel)
     
-def smoothscale_by(gif: GIFPygame, factor: Union[float, Sequence[float]], frames: Optional[Iterable[int]]=[]):
+def smoothscale_by(gif: GIFPygame, factor: Union[float, Sequence[float]], frames: Iterable[int]=(), parallel: Optional[bool]=True):
     """
     resize to new resolution, using scalar(s)
 
     :param gif: the gif that you want to tranform
     :param factor: the factor of resizing
     :param frames: (optional) choose the frames where the transformation will take affect. Leave empty to transform the entire gif
+    :param parallel: (optional) transform the frames on a thread pool, only used for gifs with at least 4 frames of 64x64 pixels or more
     """
-    old_surfs = gif.get_surfaces(frames)
-    if not frames:
-        frames = [i for i in range(len(gif.frames))]
-    new_surfs = []
-
-    for i, surf in enumerate(old_surfs):
-        new_surfs.append((pygame.transform.smoothscale_by(surf, factor), frames[i]))
-    surfaces(gif, new_surfs)
+    _apply_transform(gif, lambda surf: pygame.transform.smoothscale_by(surf, factor), frames, parallel)
     
-def box_blur(gif: GIFPygame, radius: int, repeat_edged_pixels: Optional[bool]=True, frames: Optional[Iterable[int]]=[]):
+def combine(gif: GIFPygame, flip_x: Optional[bool]=False, flip_y: Optional[bool]=False, size: Optional[Union[None, _Coordinate]]=None, factor: Optional[Union[None, float, Sequence[float]]]=None, angle: Optional[float]=0, smooth: Optional[bool]=False, frames: Iterable[int]=(), parallel: Optional[bool]=True):
+    """
+    flip, resize and rotate in a single pass over the frames, faster than calling `flip()`, `scale()` and `rotate()` one after another
+
+    :param gif: the gif that you want to tranform
+    :param flip_x: (optional) flip horizontally
+    :param flip_y: (optional) flip vertically
+    :param size: (optional) width and height of the new resolution, leave as `None` to keep the size
+    :param factor: (optional) the factor of resizing, only used if `size` is `None`
+    :param angle: (optional) the angle to rotate by
+    :param smooth: (optional) use smoothscale instead of scale when resizing
+    :param frames: (optional) choose the frames where the transformation will take affect. Leave empty to transform the entire gif
+    :param parallel: (optional) transform the frames on a thread pool, only used for gifs with at least 4 frames of 64x64 pixels or more
+    """
+    def _combine(surf):
+        if flip_x or flip_y:
+            surf = pygame.transform.flip(surf, flip_x, flip_y)
+        if size is not None:
+            surf = (pygame.transform.smoothscale if smooth else pygame.transform.scale)(surf, size)
+        elif factor is not None:
+            surf = (pygame.transform.smoothscale_by if smooth else pygame.transform.scale_by)(surf, factor)
+        if angle:
+            surf = pygame.transform.rotate(surf, angle)
+        return surf
+    _apply_transform(gif, _combine, frames, parallel)
+
+def box_blur(gif: GIFPygame, radius: int, repeat_edged_pixels: Optional[bool]=True, frames: Iterable[int]=(), parallel: Optional[bool]=False):
     """
     blur a gif using box blur
 
@@ -157,20 +219,14 @@ def box_blur(gif: GIFPygame, radius: int, repeat_edged_pixels: Optional[bool]=Tr
     :param radius: intensity of blurring
     :repeat_edged_pixels: (optional) I've got no clue
     :param frames: (optional) choose the frames where the transformation will take affect. Leave empty to transform the entire gif
+    :param parallel: (optional) transform the frames on a thread pool, only used for gifs with at least 4 frames of 64x64 pixels or more. Off by default, as the blurs showed no gain from threads
     """
     if not is_ce:
-        warnings.warn("This function, gif_pygame.transform.box_blur, won't run because your pygame version is not compatible with this function.\nPlease use pygame-ce for extra speed, better support, and better experience.\npip uninstall pygame\npip install pygame-ce", Warning, 2)
+        _apply_transform(gif, lambda surf: _pillow_blur(surf, ImageFilter.BoxBlur(radius), radius, repeat_edged_pixels), frames, parallel)
         return
-    old_surfs = gif.get_surfaces(frames)
-    if not frames:
-        frames = [i for i in range(len(gif.frames))]
-    new_surfs = []
-
-    for i, surf in enumerate(old_surfs):
-        new_surfs.append((pygame.transform.box_blur(surf, radius, repeat_edged_pixels), frames[i]))
-    surfaces(gif, new_surfs)
+    _apply_transform(gif, lambda surf: pygame.transform.box_blur(surf, radius, repeat_edged_pixels), frames, parallel)
     
-def gaussian_blur(gif: GIFPygame, radius: int, repeat_edged_pixels: Optional[bool]=True, frames: Optional[Iterable[int]]=[]):
+def gaussian_blur(gif: GIFPygame, radius: int, repeat_edged_pixels: Optional[bool]=True, frames: Iterable[int]=(), parallel: Optional[bool]=False):
     """
     blur a surface using gaussian blur (slow)
 
@@ -178,56 +234,57 @@ def gaussian_blur(gif: GIFPygame, radius: int, repeat_edged_pixels: Optional[boo
     :param radius: intensity of blurring
     :repeat_edged_pixels: (optional) I've got no clue
     :param frames: (optional) choose the frames where the transformation will take affect. Leave empty to transform the entire gif
+    :param parallel: (optional) transform the frames on a thread pool, only used for gifs with at least 4 frames of 64x64 pixels or more. Off by default, as the blurs showed no gain from threads
     """
     if not is_ce:
-        warnings.warn("This function, gif_pygame.transform.box_blur, won't run because your pygame version is not compatible with this function.\nPlease use pygame-ce for extra speed, better support, and better experience.\npip uninstall pygame\npip install pygame-ce", Warning, 2)
+        _apply_transform(gif, lambda surf: _pillow_blur(surf, ImageFilter.GaussianBlur(radius), radius, repeat_edged_pixels), frames, parallel)
         return
-    old_surfs = gif.get_surfaces(frames)
-    if not frames:
-        frames = [i for i in range(len(gif.frames))]
-    new_surfs = []
-
-    for i, surf in enumerate(old_surfs):
-        new_surfs.append((pygame.transform.gaussian_blur(surf, radius, repeat_edged_pixels), frames[i]))
-    surfaces(gif, new_surfs)
+    _apply_transform(gif, lambda surf: pygame.transform.gaussian_blur(surf, radius, repeat_edged_pixels), frames, parallel)
     
-def invert(gif: GIFPygame, frames: Optional[Iterable[int]]=[]):
+def fast_gaussian_blur(gif: GIFPygame, radius: int, repeat_edged_pixels: Optional[bool]=True, frames: Iterable[int]=(), parallel: Optional[bool]=False):
+    """
+    blur a gif with three box blurs, which look almost the same as gaussian blur but take the same time at any radius
+
+    :param gif: the gif that you want to tranform
+    :param radius: intensity of blurring
+    :param repeat_edged_pixels: (optional) blur with the edge pixels repeated past the edges, instead of transparent pixels
+    :param frames: (optional) choose the frames where the transformation will take affect. Leave empty to transform the entire gif
+    :param parallel: (optional) transform the frames on a thread pool, only used for gifs with at least 4 frames of 64x64 pixels or more. Off by default, as the blurs showed no gain from threads
+    """
+    if not is_ce:
+        _apply_transform(gif, lambda surf: _pillow_blur(surf, ImageFilter.GaussianBlur(radius), radius, repeat_edged_pixels), frames, parallel)
+        return
+    radii = _box_radii(radius)
+    _apply_transform(gif, lambda surf: _fast_gaussian_blur(surf, radii, repeat_edged_pixels), frames, parallel)
+
+def invert(gif: GIFPygame, frames: Iterable[int]=(), parallel: Optional[bool]=True):
     """
     inverts the RGB elements of a gif
 
     :param gif: the gif that you want to tranform
     :param frames: (optional) choose the frames where the transformation will take affect. Leave empty to transform the entire gif
+    :param parallel: (optional) transform the frames on a thread pool, only used for gifs with at least 4 frames of 64x64 pixels or more
     """
     if not is_ce:
-        warnings.warn("This function, gif_pygame.transform.box_blur, won't run because your pygame version is not compatible with this function.\nPlease use pygame-ce for extra speed, better support, and better experience.\npip uninstall pygame\npip install pygame-ce", Warning, 2)
+        _apply_transform(gif, _invert, frames, parallel)
         return
-    old_surfs = gif.get_surfaces(frames)
-    if not frames:
-        frames = [i for i in range(len(gif.frames))]
-    new_surfs = []
-
-    for i, surf in enumerate(old_surfs):
-        new_surfs.append((pygame.transform.invert(surf), frames[i]))
-    surfaces(gif, new_surfs)
+    _apply_in_place(gif, pygame.transform.invert, frames, parallel)
     
-def grayscale(gif: GIFPygame, frames: Optional[Iterable[int]]=[]):
+def grayscale(gif: GIFPygame, frames: Iterable[int]=(), parallel: Optional[bool]=True):
     """
     grayscale a gif
 
     :param gif: the gif that you want to tranform
     :param frames: (optional) choose the frames where the transformation will take affect. Leave empty to transform the entire gif
+    :param parallel: (optional) transform the frames on a thread pool, only used for gifs with at least 4 frames of 64x64 pixels or more
     """
-    old_surfs = gif.get_surfaces(frames)
-    if not frames:
-        frames = [i for i in range(len(gif.frames))]
-    new_surfs = []
-
-    for i, surf in enumerate(old_surfs):
-        new_surfs.append((pygame.transform.grayscale(surf), frames[i]))
-    surfaces(gif, new_surfs)
+    if not is_ce:
+        _apply_transform(gif, pygame.transform.grayscale if hasattr(pygame.transform, "grayscale") else _grayscale, frames, parallel)
+        return
+    _apply_in_place(gif, pygame.transform.grayscale, frames, parallel)
 
 
-def convert(gif: GIFPygame, colorkey: Optional[Union[None, _ColorValue]]=None, colorkey_flags: Optional[int]=0, frames: Optional[Iterable[int]]=[]):
+def convert(gif: GIFPygame, colorkey: Optional[Union[None, _ColorValue]]=None, colorkey_flags: Optional[int]=0, frames: Iterable[int]=()):
     """
     converts a gif
 
@@ -236,33 +293,160 @@ def convert(gif: GIFPygame, colorkey: Optional[Union[None, _ColorValue]]=None, c
     :param colorkey_flags: (optional) the colorkey flags, leave empty for no flags
     :param frames: (optional) choose the frames where the conversion will take affect. Leave empty to convert the entire gif
     """
-    old_surfs = gif.get_surfaces(frames)
-    if not frames:
-        frames = [i for i in range(len(gif.frames))]
-    new_surfs = []
-
-    for i, surf in enumerate(old_surfs):
+    def _convert(surf):
         surf = surf.convert()
         if colorkey:
             surf.set_colorkey(colorkey, colorkey_flags)
-        new_surfs.append((surf, frames[i]))
-    surfaces(gif, new_surfs)
+        return surf
 
-def convert_alpha(gif: GIFPygame, frames: Optional[Iterable[int]]=[]):
+    _apply_transform(gif, _convert, frames)
+
+def convert_alpha(gif: GIFPygame, frames: Iterable[int]=()):
     """
     converts a gif with alpha
 
     :param gif: the gif that you want to convert
     :param frames: (optional) choose the frames where the conversion will take affect. Leave empty to convert the entire gif
     """
-    old_surfs = gif.get_surfaces(frames)
-    if not frames:
-        frames = [i for i in range(len(gif.frames))]
-    new_surfs = []
+    _apply_transform(gif, lambda surf: surf.convert_alpha(), frames)
 
-    for i, surf in enumerate(old_surfs):
-        new_surfs.append((surf.convert_alpha(), frames[i]))
-    surfaces(gif, new_surfs)
+class Pipeline:
+    """
+    chains transformations so each frame goes through all of them before moving to the next frame
+
+    `Pipeline().scale((64, 64)).grayscale().invert().apply(gif)`
+    """
+    def __init__(self) -> None:
+        self._operations = []
+
+    def _add(self, operation: Callable[[pygame.Surface], pygame.Surface]) -> "Pipeline":
+        self._operations.append(operation)
+        return self
+
+    def _run(self, surf: pygame.Surface) -> pygame.Surface:
+        for operation in self._operations:
+            surf = operation(surf)
+        return surf
+
+    def flip(self, flip_x: bool, flip_y: bool) -> "Pipeline":
+        """
+        adds a vertical and horizontal flip
+
+        :param flip_x: flip horizontally
+        :param flip_y: flip vertically
+        """
+        return self._add(lambda surf: pygame.transform.flip(surf, flip_x, flip_y))
+
+    def scale(self, size: _Coordinate) -> "Pipeline":
+        """
+        adds a resize to new resolution
+
+        :param size: width and height of the new resolution
+        """
+        return self._add(lambda surf: pygame.transform.scale(surf, size))
+
+    def scale_by(self, factor: Union[float, Sequence[float]]) -> "Pipeline":
+        """
+        adds a resize to new resolution, using scalar(s)
+
+        :param factor: the factor of resizing
+        """
+        return self._add(lambda surf: pygame.transform.scale_by(surf, factor))
+
+    def rotate(self, angle: float) -> "Pipeline":
+        """
+        adds a rotation
+
+        :param angle: the rotation angle
+        """
+        return self._add(lambda surf: pygame.transform.rotate(surf, angle))
+
+    def rotozoom(self, angle: int, scale: float) -> "Pipeline":
+        """
+        adds a filtered scale and rotation
+
+        :param angle: the rotation angle
+        :param scale: the factor of resizing
+        """
+        return self._add(lambda surf: pygame.transform.rotozoom(surf, angle, scale))
+
+    def scale2x(self) -> "Pipeline":
+        """
+        adds the specialized frame doubler
+        """
+        return self._add(pygame.transform.scale2x)
+
+    def smoothscale(self, size: _Coordinate) -> "Pipeline":
+        """
+        adds a smooth scale to an arbitrary size
+
+        :param size: width and height of the new size
+        """
+        return self._add(lambda surf: pygame.transform.smoothscale(surf, size))
+
+    def smoothscale_by(self, factor: Union[float, Sequence[float]]) -> "Pipeline":
+        """
+        adds a smooth resize to new resolution, using scalar(s)
+
+        :param factor: the factor of resizing
+        """
+        return self._add(lambda surf: pygame.transform.smoothscale_by(surf, factor))
+
+    def box_blur(self, radius: int, repeat_edged_pixels: Optional[bool]=True) -> "Pipeline":
+        """
+        adds a box blur
+
+        :param radius: intensity of blurring
+        :param repeat_edged_pixels: (optional) blur with the edge pixels repeated past the edges, instead of transparent pixels
+        """
+        if not is_ce:
+            return self._add(lambda surf: _pillow_blur(surf, ImageFilter.BoxBlur(radius), radius, repeat_edged_pixels))
+        return self._add(lambda surf: pygame.transform.box_blur(surf, radius, repeat_edged_pixels))
+
+    def gaussian_blur(self, radius: int, repeat_edged_pixels: Optional[bool]=True) -> "Pipeline":
+        """
+        adds a gaussian blur (slow)
+
+        :param radius: intensity of blurring
+        :param repeat_edged_pixels: (optional) blur with the edge pixels repeated past the edges, instead of transparent pixels
+        """
+        if not is_ce:
+            return self._add(lambda surf: _pillow_blur(surf, ImageFilter.GaussianBlur(radius), radius, repeat_edged_pixels))
+        return self._add(lambda surf: pygame.transform.gaussian_blur(surf, radius, repeat_edged_pixels))
+
+    def fast_gaussian_blur(self, radius: int, repeat_edged_pixels: Optional[bool]=True) -> "Pipeline":
+        """
+        adds three box blurs, which look almost the same as gaussian blur but take the same time at any radius
+
+        :param radius: intensity of blurring
+        :param repeat_edged_pixels: (optional) blur with the edge pixels repeated past the edges, instead of transparent pixels
+        """
+        if not is_ce:
+            return self._add(lambda surf: _pillow_blur(surf, ImageFilter.GaussianBlur(radius), radius, repeat_edged_pixels))
+        radii = _box_radii(radius)
+        return self._add(lambda surf: _fast_gaussian_blur(surf, radii, repeat_edged_pixels))
+
+    def invert(self) -> "Pipeline":
+        """
+        adds a color inversion
+        """
+        return self._add(pygame.transform.invert if is_ce else _invert)
+
+    def grayscale(self) -> "Pipeline":
+        """
+        adds a grayscale conversion
+        """
+        return self._add(pygame.transform.grayscale if hasattr(pygame.transform, "grayscale") else _grayscale)
+
+    def apply(self, gif: GIFPygame, frames: Iterable[int]=(), parallel: Optional[bool]=True) -> None:
+        """
+        runs the chained transformations on the gif
+
+        :param gif: the gif that you want to tranform
+        :param frames: (optional) choose the frames where the transformation will take affect. Leave empty to transform the entire gif
+        :param parallel: (optional) transform the frames on a thread pool, only used for gifs with at least 4 frames of 64x64 pixels or more
+        """
+        _apply_transform(gif, self._run, frames, parallel)
 
 def surfaces(gif: GIFPygame, surfaces: Iterable[Tuple[pygame.Surface, int]]) -> None:
     """
@@ -275,38 +459,34 @@ def surfaces(gif: GIFPygame, surfaces: Iterable[Tuple[pygame.Surface, int]]) ->
 
     :raises IndexError: all of the given frame numbers given aren't an index of the frames list
     """
+    gif._detach()
+    n = len(gif._surfaces)
     failed_frames = []
     duplicated_frames = []
-    successful_frames = []
+    seen_frames = set()
 
     for index, surface in enumerate(surfaces):
-        try:
-            gif.frames[surface[1]]
-        except:
+        frame = _frame_index(surface[1], n)
+        if frame is None:
             failed_frames.append((index, surface[1]))
             continue
 
-        if surface in successful_frames:
-            duplicated_frames.append((index, surface[1]))
+        if frame in seen_frames:
+            duplicated_frames.append((index, frame))
             continue
 
         else:
-            successful_frames.append(surface)
-            gif.frames[surface[1]][0] = surface[0]
+            seen_frames.add(frame)
+            gif._surfaces[frame] = surface[0]
+    gif._update_size()
 
-    if len(successful_frames) == 0:
+    if not seen_frames:
         raise IndexError("None of the given frames are in the frames list")
     else:
         if len(failed_frames):
-            failed_str = "There were some failed frames, they were:\n"
-            for failed_frame in failed_frames:
-                failed_str += f"Frame Number: {failed_frame[1]}, Index: {failed_frame[0]}"
-            print(failed_str)
+            warnings.warn("There were some failed frames, they were:\n" + "\n".join(f"Frame Number: {frame}, Index: {index}" for index, frame in failed_frames), UserWarning, 2)
         if len(duplicated_frames):
-            duplicated_str = "There were some duplicated frames, they were:\n"
-            for duplicated_frame in duplicated_frames:
-                duplicated_str += f"Frame Number: {duplicated_frame[1]}, Index: {duplicated_frame[0]}"
-            print(duplicated_str)
+            warnings.warn("There were some duplicated frames, they were:\n" + "\n".join(f"Frame Number: {frame}, Index: {index}" for index, frame in duplicated_frames), UserWarning, 2)
 
 def durations(gif: GIFPygame, durations: Iterable[Tuple[float, int]]) -> None:
     """
@@ -319,38 +499,34 @@ def durations(gif: GIFPygame, durations: Iterable[Tuple[float, int]]) -> None:
 
     :raises IndexError: all of the given frame numbers given aren't an index of the frames list
     """
+    gif._detach()
+    n = len(gif._surfaces)
     failed_frames = []
     duplicated_frames = []
-    successful_frames = []
+    seen_frames = set()
 
     for index, duration in enumerate(durations):
-        try:
-            gif.frames[duration[1]]
-        except:
+        frame = _frame_index(duration[1], n)
+        if frame is None:
             failed_frames.append((index, duration[1]))
             continue
 
-        if duration in successful_frames:
-            duplicated_frames.append((index, duration[1]))
+        if frame in seen_frames:
+            duplicated_frames.append((index, frame))
             continue
 
         else:
-            successful_frames.append(duration)
-            gif.frames[duration[1]][1] = duration[0]
+            seen_frames.add(frame)
+            gif._durations[frame] = duration[0]
+    gif._update_timeline()
 
-    if len(successful_frames) == 0:
+    if not seen_frames:
         raise IndexError("None of the given frames are in the frames list")
     else:
         if len(failed_frames):
-            failed_str = "There were some failed frames, they were:\n"
-            for failed_frame in failed_frames:
-                failed_str += f"Frame Number: {failed_frame[1]}, Index: {failed_frame[0]}"
-            print(failed_str)
+            warnings.warn("There were some failed frames, they were:\n" + "\n".join(f"Frame Number: {frame}, Index: {index}" for index, frame in failed_frames), UserWarning, 2)
         if len(duplicated_frames):
-            duplicated_str = "There were some duplicated frames, they were:\n"
-            for duplicated_frame in duplicated_frames:
-                duplicated_str += f"Frame Number: {duplicated_frame[1]}, Index: {duplicated_frame[0]}"
-            print(duplicated_str)
+            warnings.warn("There were some duplicated frames, they were:\n" + "\n".join(f"Frame Number: {frame}, Index: {index}" for index, frame in duplicated_frames), UserWarning, 2)
 
 def datas(gif: GIFPygame, datas: Iterable[Tuple[pygame.Surface, float, int]]) -> None:
     """
@@ -363,39 +539,36 @@ def datas(gif: GIFPygame, datas: Iterable[Tuple[pygame.Surface, float, int]]) ->
 
     :raises IndexError: all of the given frame numbers given aren't an index of the frames list
     """
+    gif._detach()
+    n = len(gif._surfaces)
     failed_frames = []
     duplicated_frames = []
-    successful_frames = []
+    seen_frames = set()
 
     for index, data in enumerate(datas):
-        try:
-            gif.frames[data[2]]
-        except:
+        frame = _frame_index(data[2], n)
+        if frame is None:
             failed_frames.append((index, data[2]))
             continue
 
-        if data in successful_frames:
-            duplicated_frames.append((index, data[2]))
+        if frame in seen_frames:
+            duplicated_frames.append((index, frame))
             continue
 
         else:
-            successful_frames.append(data)
-            gif.frames[data[2]][0] = data[0]
-            gif.frames[data[2]][1] = data[1]
+            seen_frames.add(frame)
+            gif._surfaces[frame] = data[0]
+            gif._durations[frame] = data[1]
+    gif._update_timeline()
+    gif._update_size()
 
-    if len(successful_frames) == 0:
+    if not seen_frames:
         raise IndexError("None of the given frames are in the frames list")
     else:
         if len(failed_frames):
-            failed_str = "There were some failed frames, they were:\n"
-            for failed_frame in failed_frames:
-                failed_str += f"Frame Number: {failed_frame[1]}, Index: {failed_frame[0]}"
-            print(failed_str)
+            warnings.warn("There were some failed frames, they were:\n" + "\n".join(f"Frame Number: {frame}, Index: {index}" for index, frame in failed_frames), UserWarning, 2)
         if len(duplicated_frames):
-            duplicated_str = "There were some duplicated frames, they were:\n"
-            for duplicated_frame in duplicated_frames:
-                duplicated_str += f"Frame Number: {duplicated_frame[1]}, Index: {duplicated_frame[0]}"
-            print(duplicated_str)
+            warnings.warn("There were some duplicated frames, they were:\n" + "\n".join(f"Frame Number: {frame}, Index: {index}" for index, frame in duplicated_frames), UserWarning, 2)
 
 def alphas(gif: GIFPygame, alphas: Iterable[Tuple[int, int]]) -> None:
     """
@@ -408,35 +581,35 @@ def alphas(gif: GIFPygame, alphas: Iterable[Tuple[int, int]]) -> None:
 
     :raises IndexError: all of the given frame numbers given aren't an index of the frames list
     """
+    gif._detach()
+    n = len(gif._surfaces)
     failed_frames = []
     duplicated_frames = []
-    successful_frames = []
+    seen_frames = set()
+    new_alphas = []
 
     for index, alpha in enumerate(alphas):
-        try:
-            gif.frames[alpha[1]]
-        except:
+        frame = _frame_index(alpha[1], n)
+        if frame is None:
             failed_frames.append((index, alpha[1]))
             continue
 
-        if alpha in successful_frames:
-            duplicated_frames.append((index, alpha[1]))
+        if frame in seen_frames:
+            duplicated_frames.append((index, frame))
             continue
 
         else:
-            successful_frames.append(alpha)
-            gif.frames[alpha[1]][0].set_alpha(alpha[0])
+            seen_frames.add(frame)
+            new_alphas.append((frame, alpha[0]))
+
+    gif._unshare(seen_frames)
+    for frame, alpha in new_alphas:
+        gif._surfaces[frame].set_alpha(alpha)
 
-    if len(successful_frames) == 0:
+    if not seen_frames:
         raise IndexError("None of the given frames are in the frames list")
     else:
         if len(failed_frames):
-            failed_str = "There were some failed frames, they were:\n"
-            for failed_frame in failed_frames:
-                failed_str += f"Frame Number: {failed_frame[1]}, Index: {failed_frame[0]}"
-            print(failed_str)
+            warnings.warn("There were some failed frames, they were:\n" + "\n".join(f"Frame Number: {frame}, Index: {index}" for index, frame in failed_frames), UserWarning, 2)
         if len(duplicated_frames):
-            duplicated_str = "There were some duplicated frames, they were:\n"
-            for duplicated_frame in duplicated_frames:
-                duplicated_str += f"Frame Number: {duplicated_frame[1]}, Index: {duplicated_frame[0]}"
-            print(duplicated_str)
+            warnings.warn("There were some duplicated frames, they were:\n" + "\n".join(f"Frame Number: {frame}, Index: {index}" for index, frame in duplicated_frames), UserWarning, 2)
@@ -0,0 +1,38 @@
+import os, tempfile, unittest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import gif_pygame
+from PIL import Image
+
+
+def _write_transparency_flag_gif(path):
+    # frame 1 has a transparent index, frame 2 turns the transparency flag off again and is opaque green
+    first = Image.new("P", (4, 4), 0)
+    first.putpalette([255, 0, 0] + [0, 0, 255]*255)
+    second = Image.new("P", (4, 4), 0)
+    second.putpalette([0, 255, 0] + [0, 0, 0]*255)
+    first.save(path, save_all=True, append_images=[second], duration=100, disposal=2, transparency=0)
+
+    with open(path, "rb") as file:
+        data = bytearray(file.read())
+    second_control = data.index(b"\x21\xf9\x04", data.index(b"\x21\xf9\x04")+1)
+    data[second_control+3] &= ~1
+    with open(path, "wb") as file:
+        file.write(data)
+
+
+class TestLoad(unittest.TestCase):
+    def test_transparency_flag_cleared_on_later_frame(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "transparency_flag.gif")
+            _write_transparency_flag_gif(path)
+            gif = gif_pygame.load(path, pre_convert=False)
+
+        first, second = gif.get_surfaces()
+        self.assertEqual(first.get_at((0, 0)).a, 0)
+        self.assertEqual(tuple(second.get_at((0, 0))), (0, 255, 0, 255))
+
+
+if __name__ == "__main__":
+    unittest.main()